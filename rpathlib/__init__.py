@@ -1,14 +1,22 @@
+import os
 import re
+import stat
 import time
 import json
 import uuid
 import shutil
+import datetime
 import pathlib
 import asyncio
 import typing
+import fnmatch
+import functools
 import aiohttp
 import logging
+import mimetypes
+import urllib.parse
 import tempfile
+import threading
 import contextlib
 
 import rpathlib.utils
@@ -16,13 +24,76 @@ import rpathlib.utils
 logger = logging.getLogger(__name__)
 rclone = shutil.which('rclone')
 
+_STAT_OPT = dict(recurse=False, showHash=False)
+_LIST_OPT = dict(recurse=False, showHash=False, noModTime=True, noMimeType=True)
+_RGLOB_OPT = dict(recurse=True, showHash=False, noModTime=True, noMimeType=True)
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, case_sensitive: bool):
+  '''
+  Compile a glob pattern for file names into a regex match function
+  '''
+  if '/' in pattern: raise NotImplementedError('patterns spanning directories are not supported')
+  return re.compile(fnmatch.translate(pattern), 0 if case_sensitive else re.IGNORECASE).match
+
+def _format_modtime(mtime_ns: int):
+  '''
+  Format a modification time the way rclone does, RFC3339 in local time with nanoseconds
+  '''
+  seconds, nanos = divmod(mtime_ns, 1000000000)
+  t = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).astimezone()
+  offset = t.strftime('%z')
+  offset = 'Z' if offset == '+0000' else f"{offset[:3]}:{offset[3:]}"
+  fraction = f".{nanos:09d}".rstrip('0') if nanos else ''
+  return f"{t.strftime('%Y-%m-%dT%H:%M:%S')}{fraction}{offset}"
+
+def _local_item(path: str, name: str, st: os.stat_result):
+  '''
+  The item rclone's local backend would report for a stat result, paths are relative to `/`
+  '''
+  is_dir = stat.S_ISDIR(st.st_mode)
+  if is_dir:
+    mime_type = 'inode/directory'
+  else:
+    mime_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    # go's mime.TypeByExtension, which rclone uses, declares utf-8 for all text types
+    if mime_type.startswith('text/'): mime_type += '; charset=utf-8'
+  return dict(
+    Path=path,
+    Name=name,
+    Size=-1 if is_dir else st.st_size,
+    MimeType=mime_type,
+    ModTime=_format_modtime(st.st_mtime_ns),
+    IsDir=is_dir,
+  )
+
+def _split_remote(path: str):
+  '''
+  Split an rclone-style location into its remote (None if absent) and path,
+   the remote ends at the first `:` which isn't inside a `"`-quoted region
+  '''
+  start = i = 1 if path.startswith(':') else 0
+  while True:
+    colon = path.find(':', i)
+    if colon == -1 or colon == start: return None, path
+    quote = path.find('"', i, colon)
+    if quote == -1: return path[:colon+1], path[colon+1:]
+    i = path.find('"', quote+1) + 1
+    if i == 0: return None, path
+
 class RPath:
   ''' Like pathlib's Path but supporting rclone-facilitated remote operation
+
+  RPaths are immutable (they are hashed by remote & path), so derived properties are cached
+   in slots which are filled on first access
   '''
+  __slots__ = ('remote', 'path', '_cached_parent', '_cached_fs', '_cached_remote')
   remote: str
   path: pathlib.PurePosixPath
   client: typing.Optional[typing.Callable] = None
   a_client: typing.Optional[typing.Callable] = None
+  download: typing.Optional[typing.Callable] = None
+  a_download: typing.Optional[typing.Callable] = None
 
   def __init__(self, path='', remote=None):
     '''
@@ -39,16 +110,26 @@ class RPath:
       if remote is not None:
         self.remote = remote
         self.path = pathlib.PurePosixPath(path)
-      elif isinstance(path, pathlib.Path):
+      elif isinstance(path, pathlib.PurePath):
         self.path = pathlib.PurePosixPath(path.as_posix())
         self.remote = ':local:'
       elif isinstance(path, str):
-        self.remote, _, path = re.match(r'''^((:?[^:"]+|"[^"]*")+:)?(.*)$''', path).groups()
+        self.remote, path = _split_remote(path)
         self.path = pathlib.PurePosixPath(path)
         if self.remote is None: self.remote = ':local:'
       else:
         raise NotImplementedError(type(path))
 
+  @classmethod
+  def _unchecked(cls, path: pathlib.PurePosixPath, remote: str):
+    '''
+    Construct an RPath from an already parsed path & remote, skipping __init__
+    '''
+    self = object.__new__(cls)
+    self.path = path
+    self.remote = remote
+    return self
+
   @property
   def name(self):
     '''
@@ -68,16 +149,26 @@ class RPath:
     '''
     The parent to this directory
     '''
-    return RPath(self.path.parent, remote=self.remote)
+    try: return self._cached_parent
+    except AttributeError:
+      self._cached_parent = RPath._unchecked(self.path.parent, self.remote)
+      return self._cached_parent
 
   @property
   def _fs(self):
-    if self.remote == ':local:':
-      return '/' if self.path.is_absolute() else ':local:'
-    return self.remote
+    try: return self._cached_fs
+    except AttributeError:
+      if self.remote == ':local:':
+        self._cached_fs = '/' if self.path.is_absolute() else ':local:'
+      else:
+        self._cached_fs = self.remote
+      return self._cached_fs
   @property
   def _remote(self):
-    return '' if self.path == pathlib.PurePosixPath() else str(self.path)
+    try: return self._cached_remote
+    except AttributeError:
+      self._cached_remote = '' if self.path == pathlib.PurePosixPath() else str(self.path)
+      return self._cached_remote
 
   def __str__(self):
     return f"{self._fs}{self._remote}"
@@ -89,13 +180,73 @@ class RPath:
     return hash((self.remote, self.path))
 
   def __eq__(self, value):
-    return repr(self) == repr(RPath(value) if not isinstance(value, RPath) else value)
+    if isinstance(value, (str, pathlib.PurePath)): value = RPath(value)
+    elif not isinstance(value, RPath): return NotImplemented
+    return self.remote == value.remote and self.path == value.path
 
   def __truediv__(self, value):
-    return RPath(self.path/value, remote=self.remote)
+    return RPath._unchecked(self.path/value, self.remote)
   
+  @property
+  def _is_local(self):
+    # only absolute paths can skip rclone, relative ones are resolved by the rclone
+    #  daemon against its own working directory
+    return self._fs == '/'
+
+  # like rclone's local backend (without -L/-l), symlinks are skipped entirely
+  def _local_stat(self):
+    try: st = os.lstat(self.path)
+    except (FileNotFoundError, NotADirectoryError): raise FileNotFoundError(self._remote) from None
+    if stat.S_ISLNK(st.st_mode): raise FileNotFoundError(self._remote)
+    return _local_item(self._remote.lstrip('/'), self.name, st)
+
+  def _local_stat_many(self, names):
+    names = set(names)
+    try: entries = os.scandir(self.path)
+    except (FileNotFoundError, NotADirectoryError): raise FileNotFoundError(self.path) from None
+    stats = {}
+    with entries:
+      for entry in entries:
+        if entry.name not in names: continue
+        # an entry which can't be stat'd (e.g. removed since listing) is treated as absent
+        try:
+          if entry.is_symlink(): continue
+          st = entry.stat(follow_symlinks=False)
+        except OSError: continue
+        stats[entry.name] = _local_item(entry.path.lstrip('/'), entry.name, st)
+    return stats
+
+  def _local_iterdir(self):
+    try:
+      with os.scandir(self.path) as entries:
+        return [RPath._unchecked(self.path/entry.name, self.remote) for entry in entries if not entry.is_symlink()]
+    except (FileNotFoundError, NotADirectoryError):
+      raise FileNotFoundError(self.path) from None
+
+  def _local_rglob(self, match):
+    if not os.path.isdir(self.path): raise FileNotFoundError(self.path)
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(self.path):
+      dirpath = pathlib.PurePosixPath(dirpath)
+      # os.walk doesn't descend into symlinked directories but still lists them
+      for name in dirnames + filenames:
+        if match(name) and not os.path.islink(dirpath/name):
+          paths.append(RPath._unchecked(dirpath/name, self.remote))
+    return paths
+
+  def _local_read_text(self, encoding):
+    return pathlib.Path(self.path).read_bytes().decode(encoding)
+
+  def _local_write_text(self, text, encoding):
+    path = pathlib.Path(self.path)
+    # rclone creates missing parents on upload
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(text.encode(encoding))
+    return len(text)
+
   async def a_stat(self):
-    ret = await RPath.a_client('operations/stat', fs=self._fs, remote=self._remote, opt=json.dumps(dict(recurse=False, showHash=False)))
+    if self._is_local: return await asyncio.to_thread(self._local_stat)
+    ret = await RPath.a_client('operations/stat', json_body=dict(fs=self._fs, remote=self._remote, opt=_STAT_OPT))
     if not ret.get('item'): raise FileNotFoundError(self._remote)
     return ret['item']
 
@@ -103,7 +254,8 @@ class RPath:
     '''
     Information about this file/directory path
     '''
-    ret = RPath.client('operations/stat', fs=self._fs, remote=self._remote, opt=json.dumps(dict(recurse=False, showHash=False)))
+    if self._is_local: return self._local_stat()
+    ret = RPath.client('operations/stat', json_body=dict(fs=self._fs, remote=self._remote, opt=_STAT_OPT))
     if not ret.get('item'): raise FileNotFoundError(self._remote)
     return ret['item']
 
@@ -117,6 +269,37 @@ class RPath:
     except FileNotFoundError: return False
     else: return True
 
+  async def a_stat_many(self, names):
+    if self._is_local: return await asyncio.to_thread(self._local_stat_many, names)
+    ret = await RPath.a_client('operations/list', json_body=dict(fs=self._fs, remote=self._remote, opt=_STAT_OPT))
+    if 'list' not in ret: raise FileNotFoundError(self.path)
+    names = set(names)
+    return {item['Name']: item for item in ret['list'] if item['Name'] in names}
+
+  def stat_many(self, names):
+    '''
+    Information about several files/directories in this directory with a single listing,
+     names which don't exist are omitted from the result
+    '''
+    if self._is_local: return self._local_stat_many(names)
+    ret = RPath.client('operations/list', json_body=dict(fs=self._fs, remote=self._remote, opt=_STAT_OPT))
+    if 'list' not in ret: raise FileNotFoundError(self.path)
+    names = set(names)
+    return {item['Name']: item for item in ret['list'] if item['Name'] in names}
+
+  async def a_exists_many(self, names):
+    names = list(names)
+    stats = await self.a_stat_many(names)
+    return {name: name in stats for name in names}
+
+  def exists_many(self, names):
+    '''
+    Check existence of several files/directories in this directory with a single listing
+    '''
+    names = list(names)
+    stats = self.stat_many(names)
+    return {name: name in stats for name in names}
+
   async def a_is_file(self):
     stat = await self.a_stat()
     return not stat['IsDir']
@@ -135,13 +318,15 @@ class RPath:
       try:
         yield pathlib.Path(tmpdir)
       finally:
+        delay = 0.01
         while True:
           ret = await RPath.a_client('vfs/stats', fs=str(self))
           if ret['diskCache']['uploadsInProgress'] or ret['diskCache']['uploadsQueued']:
-            time.sleep(0.1)
+            await asyncio.sleep(delay)
+            delay = min(delay*2, 0.1)
           else:
             break
-        time.sleep(0.1)
+        await asyncio.sleep(0.1)
         await RPath.a_client('mount/unmount', mountPoint=tmpdir)
 
   @contextlib.contextmanager
@@ -154,10 +339,12 @@ class RPath:
       try:
         yield pathlib.Path(tmpdir)
       finally:
+        delay = 0.01
         while True:
           ret = RPath.client('vfs/stats', fs=str(self))
           if ret['diskCache']['uploadsInProgress'] or ret['diskCache']['uploadsQueued']:
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay*2, 0.1)
           else:
             break
         time.sleep(0.1)
@@ -174,25 +361,31 @@ class RPath:
         yield fh
 
   async def a_unlink(self):
-    await RPath.a_client('operations/deletefile', fs=self._fs, remote=self._remote)
+    ret = await RPath.a_client('operations/deletefile', fs=self._fs, remote=self._remote)
+    if 'error' in ret:
+      if 'not found' in ret['error'] or 'no such file or directory' in ret['error']:
+        raise FileNotFoundError(self.path)
+      else:
+        raise RuntimeError(ret['error'])
   
   def unlink(self):
-    RPath.client('operations/deletefile', fs=self._fs, remote=self._remote)
+    ret = RPath.client('operations/deletefile', fs=self._fs, remote=self._remote)
+    if 'error' in ret:
+      if 'not found' in ret['error'] or 'no such file or directory' in ret['error']:
+        raise FileNotFoundError(self.path)
+      else:
+        raise RuntimeError(ret['error'])
   
   async def a_mkdir(self, parents=False, exist_ok=False):
-    if await self.a_exists():
-      if not exist_ok:
-        raise FileExistsError(self.path)
-      else:
-        return
+    # rclone's mkdir is idempotent, we only need to probe to report existing directories
+    if not exist_ok and await self.a_exists():
+      raise FileExistsError(self.path)
     await RPath.a_client('operations/mkdir', fs=self._fs, remote=self._remote)
 
   def mkdir(self, parents=False, exist_ok=False):
-    if self.exists():
-      if not exist_ok:
-        raise FileExistsError(self.path)
-      else:
-        return
+    # rclone's mkdir is idempotent, we only need to probe to report existing directories
+    if not exist_ok and self.exists():
+      raise FileExistsError(self.path)
     RPath.client('operations/mkdir', fs=self._fs, remote=self._remote)
 
   async def a_rmdir(self):
@@ -215,75 +408,69 @@ class RPath:
       else:
         raise RuntimeError(ret['error'])
 
+  def _resolve_other(self, other):
+    '''
+    Resolve the target of a copy/rename, strings without a remote are relative to our parent
+    '''
+    if isinstance(other, RPath): return other
+    if not isinstance(other, str): raise NotImplementedError(type(other))
+    other_remote, other_path = _split_remote(other)
+    if other_remote is not None:
+      return RPath(other_path, other_remote)
+    elif other_path.startswith('/'):
+      return RPath(other_path, self.remote)
+    else:
+      return RPath(self.path.parent / other_path, self.remote)
+
   async def a_copyfile(self, other):
-    if isinstance(other, str):
-      other_remote, _, other_path = re.match(r'''^((:?[^:"]+|"[^"]*")+:)?(.*)$''', other).groups()
-      if other_remote is None:
-        other_remote = self.remote
-      if other_path.startswith('/'):
-        other = RPath(other_path, other_remote)
-      else:
-        other = self.parent / pathlib.PurePath(other_path)
-    if not isinstance(other, RPath): raise NotImplementedError(type(other))
+    other = self._resolve_other(other)
     await RPath.a_client('operations/copyfile', srcFs=self._fs, srcRemote=self._remote, dstFs=other._fs, dstRemote=other._remote)
 
   def copyfile(self, other):
-    if isinstance(other, str):
-      other_remote, _, other_path = re.match(r'''^((:?[^:"]+|"[^"]*")+:)?(.*)$''', other).groups()
-      if other_remote is None:
-        other_remote = self.remote
-      if other_path.startswith('/'):
-        other = RPath(other_path, other_remote)
-      else:
-        other = self.parent / pathlib.PurePath(other_path)
-    if not isinstance(other, RPath): raise NotImplementedError(type(other))
+    other = self._resolve_other(other)
     RPath.client('operations/copyfile', srcFs=self._fs, srcRemote=self._remote, dstFs=other._fs, dstRemote=other._remote)
 
   async def a_rename(self, other):
-    if isinstance(other, str):
-      other_remote, _, other_path = re.match(r'''^((:?[^:"]+|"[^"]*")+:)?(.*)$''', other).groups()
-      if other_remote is None:
-        other_remote = self.remote
-      if other_path.startswith('/'):
-        other = RPath(other_path, other_remote)
-      else:
-        other = self.parent / pathlib.PurePath(other_path)
-    if not isinstance(other, RPath): raise NotImplementedError(type(other))
+    other = self._resolve_other(other)
     await RPath.a_client('operations/movefile', srcFs=self._fs, srcRemote=self._remote, dstFs=other._fs, dstRemote=other._remote)
 
   def rename(self, other):
-    if isinstance(other, str):
-      other_remote, _, other_path = re.match(r'''^((:?[^:"]+|"[^"]*")+:)?(.*)$''', other).groups()
-      if other_remote is None:
-        other_remote = self.remote
-      if other_path.startswith('/'):
-        other = RPath(other_path, other_remote)
-      else:
-        other = self.parent / pathlib.PurePath(other_path)
-    if not isinstance(other, RPath): raise NotImplementedError(type(other))
+    other = self._resolve_other(other)
     RPath.client('operations/movefile', srcFs=self._fs, srcRemote=self._remote, dstFs=other._fs, dstRemote=other._remote)
 
   async def a_iterdir(self):
+    if self._is_local:
+      for path in await asyncio.to_thread(self._local_iterdir):
+        yield path
+      return
     # TODO: suppose the directory is very large?
-    ret = await RPath.a_client('operations/list', fs=self._fs, remote=self._remote, opt=json.dumps(dict(recurse=False, showHash=False)))
+    ret = await RPath.a_client('operations/list', json_body=dict(fs=self._fs, remote=self._remote, opt=_LIST_OPT))
     try:
       for file in ret['list']:
-        yield self/file['Name']
+        yield RPath._unchecked(self.path/file['Name'], self.remote)
     except KeyError:
       # TODO: handle other errors like client/server down
       raise FileNotFoundError(self.path)
 
   def iterdir(self):
+    if self._is_local:
+      yield from self._local_iterdir()
+      return
     # TODO: suppose the directory is very large?
-    ret = RPath.client('operations/list', fs=self._fs, remote=self._remote, opt=json.dumps(dict(recurse=False, showHash=False)))
+    ret = RPath.client('operations/list', json_body=dict(fs=self._fs, remote=self._remote, opt=_LIST_OPT))
     try:
       for file in ret['list']:
-        yield self/file['Name']
+        yield RPath._unchecked(self.path/file['Name'], self.remote)
     except KeyError:
       # TODO: handle other errors like client/server down
       raise FileNotFoundError(self.path)
 
   async def a_read_text(self, encoding='utf-8') -> str:
+    if self._is_local: return await asyncio.to_thread(self._local_read_text, encoding)
+    data = await RPath.a_download(self._fs, self._remote)
+    if data is not None:
+      return data.decode(encoding)
+    # not served directly, find out why and fall back to cat
     if not await self.a_is_file():
       raise IsADirectoryError(self.path)
     ret = await RPath.a_client('core/command', command='cat', arg=json.dumps(['--quiet', str(self)]))
@@ -295,6 +482,11 @@ class RPath:
     return ret['result']
 
   def read_text(self, encoding='utf-8') -> str:
+    if self._is_local: return self._local_read_text(encoding)
+    data = RPath.download(self._fs, self._remote)
+    if data is not None:
+      return data.decode(encoding)
+    # not served directly, find out why and fall back to cat
     if not self.is_file():
       raise IsADirectoryError(self.path)
     ret = RPath.client('core/command', command='cat', arg=json.dumps(['--quiet', str(self)]))
@@ -306,34 +498,61 @@ class RPath:
     return ret['result']
 
   async def a_write_text(self, text: str, encoding='utf-8') -> int:
+    if self._is_local: return await asyncio.to_thread(self._local_write_text, text, encoding)
+    # rclone's uploadfile only accepts multipart uploads, but we can hand it raw bytes
     formData = aiohttp.FormData()
-    formData.add_field('file', text, filename=self.name)
+    formData.add_field('file', text.encode(encoding), filename=self.name, content_type='application/octet-stream')
     await RPath.a_client('operations/uploadfile', formData, fs=self._fs, remote=self.parent._remote)
     return len(text)
   
   def write_text(self, text: str, encoding='utf-8') -> int:
+    if self._is_local: return self._local_write_text(text, encoding)
+    # rclone's uploadfile only accepts multipart uploads, but we can hand it raw bytes
     formData = aiohttp.FormData()
-    formData.add_field('file', text, filename=self.name)
+    formData.add_field('file', text.encode(encoding), filename=self.name, content_type='application/octet-stream')
     ret = RPath.client('operations/uploadfile', formData, fs=self._fs, remote=self.parent._remote)
     return len(text)
   
   def glob(self, pattern, *, case_sensitive=False):
     raise NotImplementedError()
 
+  def _rglob_matches(self, ret, match):
+    # listed paths are relative to the fs, make them relative to us
+    prefix = self._remote.strip('/')
+    prefix = f"{prefix}/" if prefix else ''
+    try:
+      for file in ret['list']:
+        if match(file['Name']):
+          # depending on how the remote was given, rclone may keep a leading `/`
+          path = file['Path'].lstrip('/')
+          if prefix:
+            if not path.startswith(prefix): raise RuntimeError(f"Unexpected path {path} listed under {self._remote}")
+            path = path[len(prefix):]
+          yield self/path
+    except KeyError:
+      raise FileNotFoundError(self.path)
+
+  async def a_rglob(self, pattern, *, case_sensitive=False):
+    match = _compile_pattern(pattern, case_sensitive)
+    if self._is_local:
+      for path in await asyncio.to_thread(self._local_rglob, match):
+        yield path
+      return
+    ret = await RPath.a_client('operations/list', json_body=dict(fs=self._fs, remote=self._remote, opt=_RGLOB_OPT))
+    for path in self._rglob_matches(ret, match):
+      yield path
+
   def rglob(self, pattern, *, case_sensitive=False):
-    raise NotImplementedError()
-    import fnmatch; _fnmatch = fnmatch.fnmatchcase if case_sensitive else fnmatch.fnmatch
-    if self.is_dir():
-      Q = [p for p in self.iterdir()]
-      while Q:
-        path = Q.pop()
-        if path.is_file():
-          if _fnmatch(path.name, pattern):
-            yield path
-        elif path.is_dir():
-          if _fnmatch(path.name, pattern):
-            yield path
-          Q += [p for p in path.iterdir()]
+    '''
+    Files/directories anywhere below this directory whose name matches the pattern,
+     the tree is listed by rclone in one go
+    '''
+    match = _compile_pattern(pattern, case_sensitive)
+    if self._is_local:
+      yield from self._local_rglob(match)
+      return
+    ret = RPath.client('operations/list', json_body=dict(fs=self._fs, remote=self._remote, opt=_RGLOB_OPT))
+    yield from self._rglob_matches(ret, match)
 
 class RCloneExited(Exception): pass
 
@@ -355,6 +574,14 @@ async def rclone_rcd(socket_path: pathlib.Path):
     await proc.wait()
     raise
 
+# several bridges may be running at once (e.g. awith_rclone inside with_rclone), the most
+#  recently started one which is still running is the one installed on RPath
+_bridges_lock = threading.Lock()
+_bridges = []
+
+def _install_bridge():
+  RPath.client, RPath.a_client, RPath.download, RPath.a_download = _bridges[-1] if _bridges else (None, None, None, None)
+
 async def rclone_rc_bridge(socket_path: pathlib.Path):
   '''
   Facilitate remote calls to rclone over the unix socket
@@ -362,25 +589,86 @@ async def rclone_rc_bridge(socket_path: pathlib.Path):
   :param socket_path: The unix socket rclone runs on
   :type socket_path: pathlib.Path
   '''
-  async def a_client(operation, formData=None, **params):
-    async with aiohttp.ClientSession(connector=aiohttp.UnixConnector(path=str(socket_path.absolute()))) as session:
-      async with session.post(
-        f"http://localhost/{operation}",
-        data=formData,
-        params=params,
-      ) as resp:
-        return await resp.json()
-  RPath.a_client = lambda operation, formData=None, a_client=a_client, **params: asyncio.create_task(a_client(operation, formData=formData, **params))
-  def client(operation, formData=None, **params):
-    ret = asyncio.run_coroutine_threadsafe(a_client(operation, formData=formData, **params), asyncio.get_event_loop()).result()
-    logger.debug(f"{operation=} {formData=} {params=} {ret=}")
+  loop = asyncio.get_running_loop()
+  # a single keep-alive session is shared by all calls for the lifetime of the bridge
+  session = aiohttp.ClientSession(connector=aiohttp.UnixConnector(path=str(socket_path.absolute()), limit=0, force_close=False))
+  async def a_client(operation, formData=None, json_body=None, **params):
+    async with session.post(
+      f"http://localhost/{operation}",
+      data=formData,
+      json=json_body,
+      params=params,
+    ) as resp:
+      return await resp.json()
+  async def a_download(fs, remote):
+    # with --rc-serve, rclone serves objects directly at /[fs]/remote
+    remote = remote.lstrip('/')
+    # but /[fs]/ is a directory listing, the root is never an object
+    if not remote: return None
+    path = f"{urllib.parse.quote(f'[{fs}]', safe='')}/{urllib.parse.quote(remote)}"
+    async with session.get(f"http://localhost/{path}") as resp:
+      if resp.status != 200: return None
+      return await resp.read()
+  def a_submit(coro):
+    if asyncio.get_running_loop() is loop:
+      return asyncio.create_task(coro)
+    else:
+      # the session belongs to the bridge's loop, hand the call over if we're on another one
+      return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+  def submit(coro):
+    try: running_loop = asyncio.get_running_loop()
+    except RuntimeError: pass
+    else:
+      # blocking on the loop which is supposed to answer us would never return
+      if running_loop is loop:
+        coro.close()
+        raise RuntimeError('Synchronous RPath methods cannot be used from the rclone event loop, use the a_ methods instead')
+    # calls from several threads already run concurrently on the loop over the unlimited
+    #  connector, batching them here would only add latency; batch at the API level instead
+    #  (e.g. stat_many) to save round-trips
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+  def client(operation, formData=None, json_body=None, **params):
+    ret = submit(a_client(operation, formData=formData, json_body=json_body, **params))
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(f"{operation=} {formData=} {json_body=} {params=} {ret=}")
     return ret
-  RPath.client = client
+  bridge = (
+    client,
+    lambda operation, formData=None, json_body=None, **params: a_submit(a_client(operation, formData=formData, json_body=json_body, **params)),
+    lambda fs, remote: submit(a_download(fs, remote)),
+    lambda fs, remote: a_submit(a_download(fs, remote)),
+  )
+  with _bridges_lock:
+    _bridges.append(bridge)
+    _install_bridge()
   try:
     await asyncio.Event().wait()
   finally:
-    RPath.a_client = None
-    RPath.client = None
+    with _bridges_lock:
+      _bridges.remove(bridge)
+      _install_bridge()
+    await session.close()
+
+async def rclone_rc_ready(timeout: float = 5.0):
+  '''
+  Wait for rclone to answer remote calls, polling with exponential backoff
+  
+  :param timeout: How long to wait before giving up
+  :type timeout: float
+  '''
+  loop = asyncio.get_running_loop()
+  deadline = loop.time() + timeout
+  delay = 0.005
+  while True:
+    if RPath.a_client is not None:
+      try:
+        await RPath.a_client('rc/noop')
+        return
+      except (aiohttp.ClientError, OSError):
+        pass
+    if loop.time() >= deadline: raise TimeoutError('rclone did not become ready')
+    await asyncio.sleep(delay)
+    delay = min(delay*2, 0.1)
 
 @contextlib.asynccontextmanager
 async def awith_rclone():
@@ -389,13 +677,52 @@ async def awith_rclone():
     asyncio.create_task(rclone_rcd(socket_path)),
     asyncio.create_task(rclone_rc_bridge(socket_path)),
   ):
-    await asyncio.sleep(1)# TODO confirm client is ready
+    # let the bridge install its client before we probe through it
+    await asyncio.sleep(0)
+    await rclone_rc_ready()
     yield
 
+def _run_shared_rclone(ready: threading.Event, done: threading.Event, errors: list):
+  # the shared rclone is owned by this thread from start to finish, so the event loop
+  #  setup/teardown doesn't depend on which with_rclone user comes first or leaves last
+  try:
+    with rpathlib.utils.with_awith(awith_rclone()):
+      ready.set()
+      done.wait()
+  except BaseException as e:
+    errors.append(e)
+  finally:
+    ready.set()
+
+_rclone_lock = threading.Lock()
+_rclone_refcount = 0
+_rclone_shared = None
+
 @contextlib.contextmanager
 def with_rclone():
   '''
-  Run rclone services for the duration of the contextmanager
+  Run rclone services for the duration of the contextmanager, nested or concurrent uses
+   share one rclone which is stopped when the last of them exits
   '''
-  with rpathlib.utils.with_awith(awith_rclone()):
+  global _rclone_refcount, _rclone_shared
+  with _rclone_lock:
+    if _rclone_refcount == 0:
+      ready, done, errors = threading.Event(), threading.Event(), []
+      thread = threading.Thread(target=_run_shared_rclone, args=(ready, done, errors), daemon=True)
+      thread.start()
+      ready.wait()
+      if errors:
+        thread.join()
+        raise errors[0]
+      _rclone_shared = thread, done, errors
+    _rclone_refcount += 1
+  try:
     yield
+  finally:
+    with _rclone_lock:
+      _rclone_refcount -= 1
+      if _rclone_refcount == 0:
+        (thread, done, errors), _rclone_shared = _rclone_shared, None
+        done.set()
+        thread.join()
+        if errors: raise errors[0]
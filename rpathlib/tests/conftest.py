@@ -0,0 +1,9 @@
+import pytest
+import rpathlib
+
+@pytest.fixture(scope='session')
+def rclone():
+  ''' Keep one rclone running for the whole session, the fixtures' with_rclone then reuse it
+  '''
+  with rpathlib.with_rclone():
+    yield
@@ -6,7 +6,7 @@ import pathlib
   p.stem
   for p in pathlib.Path(__file__).parent.glob('[!_]*.py')
 ])
-def rpath(request):
+def rpath(request, rclone):
   ''' Load different implementations from fixtures directory to be tested uniformly
   '''
   import importlib
@@ -16,7 +16,7 @@ def rpath(request):
   p.stem
   for p in pathlib.Path(__file__).parent.glob('[!_]*.py')
 ])
-async def a_rpath(request):
+async def a_rpath(request, rclone):
   ''' Load different implementations from fixtures directory to be tested uniformly
   '''
   import importlib
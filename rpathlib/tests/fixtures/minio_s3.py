@@ -1,38 +1,37 @@
+import sys
 import json
+import time
+import uuid
 import pytest
+import shutil
+import atexit
+import functools
 import rpathlib
 
 def safe_predicate(predicate):
   try: return predicate()
   except: return False
 
-def wait_for(predicate, interval=0.1, timeout=2.0):
-  import time
+def wait_for(predicate, timeout=2.0):
+  delay = 0.005
+  deadline = time.monotonic() + timeout
   while not predicate():
-    time.sleep(interval)
-    timeout -= interval
-    if timeout <= 0: raise TimeoutError()
+    if time.monotonic() >= deadline: raise TimeoutError()
+    time.sleep(delay)
+    delay = min(delay*2, 0.1)
 
-def rpath():
-  import shutil
-  # look for the docker command for running an s3 server
-  docker = shutil.which('docker')
-  if docker is None:
-    pytest.skip('docker binary not available')
-    return
-  import sys
-  from subprocess import check_call
-  if check_call([
-    docker, 'pull', 'minio/minio'], 
-    stderr=sys.stderr,
-    stdout=sys.stdout,
-  ) != 0:
-    pytest.skip('dockerized minio not available')
-    return
-  import sys
-  import uuid
+@functools.lru_cache(maxsize=None)
+def docker_pull(docker: str, image: str):
+  ''' Pull the image at most once per test session
+  '''
+  from subprocess import call
+  return call([docker, 'pull', image], stderr=sys.stderr, stdout=sys.stdout) == 0
+
+@functools.lru_cache(maxsize=None)
+def minio_server(docker: str):
+  ''' Start a minio server shared by all tests in the session, it's stopped at exit
+  '''
   import socket
-  import functools
   from urllib.request import Request, urlopen
   from subprocess import Popen
   # generate credentials for minio
@@ -54,13 +53,27 @@ def rpath():
     stderr=sys.stderr,
     stdout=sys.stdout,
   )
-  # wait for minio to be running & ready
-  wait_for(functools.partial(safe_predicate, lambda: urlopen(Request(f"http://localhost:{port}/minio/health/live", method='HEAD')).status == 200))
-  try:
-    with rpathlib.with_rclone():
-      p = rpathlib.RPath(f":s3,provider=Minio,endpoint={json.dumps(f'http://localhost:{port}')},access_key_id={json.dumps(MINIO_ROOT_USER)},secret_access_key={json.dumps(MINIO_ROOT_PASSWORD)},directory_markers=true:")
-      (p/'test').mkdir()
-      yield p/'test'
-  finally:
+  @atexit.register
+  def stop():
     proc.terminate()
     proc.wait()
+  # wait for minio to be running & ready
+  wait_for(functools.partial(safe_predicate, lambda: urlopen(Request(f"http://localhost:{port}/minio/health/live", method='HEAD')).status == 200))
+  return port, MINIO_ROOT_USER, MINIO_ROOT_PASSWORD
+
+def rpath():
+  # look for the docker command for running an s3 server
+  docker = shutil.which('docker')
+  if docker is None:
+    pytest.skip('docker binary not available')
+    return
+  if not docker_pull(docker, 'minio/minio'):
+    pytest.skip('dockerized minio not available')
+    return
+  port, MINIO_ROOT_USER, MINIO_ROOT_PASSWORD = minio_server(docker)
+  with rpathlib.with_rclone():
+    p = rpathlib.RPath(f":s3,provider=Minio,endpoint={json.dumps(f'http://localhost:{port}')},access_key_id={json.dumps(MINIO_ROOT_USER)},secret_access_key={json.dumps(MINIO_ROOT_PASSWORD)},directory_markers=true:")
+    # the server is shared, so each test gets its own bucket
+    bucket = p/str(uuid.uuid4())
+    bucket.mkdir()
+    yield bucket
@@ -7,12 +7,14 @@ def safe_predicate(predicate):
   try: return predicate()
   except: return False
 
-def wait_for(predicate, interval=0.1, timeout=2.0):
+def wait_for(predicate, timeout=2.0):
   import time
+  delay = 0.005
+  deadline = time.monotonic() + timeout
   while not predicate():
-    time.sleep(interval)
-    timeout -= interval
-    if timeout <= 0: raise TimeoutError()
+    if time.monotonic() >= deadline: raise TimeoutError()
+    time.sleep(delay)
+    delay = min(delay*2, 0.1)
 
 def nc_z(host: str, port: int, timeout: int = 1):
   ''' Like nc -z but in python -- i.e. check if a tcp connection gets established
@@ -0,0 +1,13 @@
+import rpathlib
+from rpathlib.tests.fixtures import rclone_sftp
+
+def rpath():
+  ''' Like rclone_sftp but addressing a directory by its absolute path (remote:/test)
+  '''
+  sftp = rclone_sftp.rpath()
+  try:
+    p = rpathlib.RPath('/test', remote=next(sftp).remote)
+    p.mkdir()
+    yield p
+  finally:
+    sftp.close()
@@ -17,9 +17,40 @@ async def test_async(a_rpath: rpathlib.RPath):
   #   fh.write(b'!')
   assert await (a_rpath/'b').a_read_text() == 'hi\n'
   assert {'b'} == {f.name async for f in a_rpath.a_iterdir()}
+  assert await a_rpath.a_exists_many(['b', 'c']) == {'b': True, 'c': False}
+  assert {a_rpath/'b'} == {f async for f in a_rpath.a_rglob('*')}
   await (a_rpath/'b').a_rename('c')
   with pytest.raises(FileNotFoundError):
     await (a_rpath/'b').a_read_text()
   assert {'c'} == {f.name async for f in a_rpath.a_iterdir()}
   await (a_rpath/'c').a_unlink()
   assert not await (a_rpath/'c').a_exists()
+  with pytest.raises(FileNotFoundError):
+    await (a_rpath/'c').a_unlink()
+
+@pytest.mark.asyncio
+async def test_async_mount_concurrent(a_rpath: rpathlib.RPath):
+  names = ['x', 'y', 'z']
+  await asyncio.gather(*((a_rpath/name).a_mkdir() for name in names))
+  async def write_mounted(name):
+    async with (a_rpath/name).a_mount() as p:
+      await asyncio.to_thread((p/'f').write_text, name)
+  # mount teardown must not block the event loop for the other mounts, a blocking
+  #  sleep would show up as a long gap between the ticker's iterations
+  loop = asyncio.get_running_loop()
+  gaps = []
+  async def ticker():
+    last = loop.time()
+    while True:
+      await asyncio.sleep(0.005)
+      now = loop.time()
+      gaps.append(now - last)
+      last = now
+  tick = asyncio.create_task(ticker())
+  try:
+    await asyncio.gather(*(write_mounted(name) for name in names))
+  finally:
+    tick.cancel()
+  assert max(gaps) < 0.09, max(gaps)
+  for name in names:
+    assert await (a_rpath/name/'f').a_read_text() == name
@@ -6,6 +6,10 @@ def test_general(rpath: rpathlib.RPath):
   rpath.mkdir(parents=True, exist_ok=True)
   (rpath/'a').mkdir()
   assert (rpath/'a').stat()['IsDir']
+  with pytest.raises(IsADirectoryError):
+    (rpath/'a').read_text()
+  with pytest.raises(FileNotFoundError):
+    (rpath/'z').read_text()
   with pytest.raises(FileNotFoundError):
     (rpath/'b').stat()
   (rpath/'b').write_text('hi\n')
@@ -16,6 +20,12 @@ def test_general(rpath: rpathlib.RPath):
     fh.write(b'!')
   assert (rpath/'b').read_text() == 'hi!'
   assert {'a', 'b'} == {f.name for f in rpath.iterdir()}
+  assert rpath.exists_many(['a', 'b', 'c']) == {'a': True, 'b': True, 'c': False}
+  assert rpath.stat_many(['a', 'b', 'c']).keys() == {'a', 'b'}
+  assert {rpath/'a', rpath/'b'} == set(rpath.rglob('*'))
+  assert {rpath/'b'} == set(rpath.rglob('B'))
+  with pytest.raises(NotImplementedError):
+    list(rpath.rglob('a/*'))
   (rpath/'a').rmdir()
   with pytest.raises(FileNotFoundError):
     (rpath/'a').rmdir()
@@ -27,3 +37,9 @@ def test_general(rpath: rpathlib.RPath):
   assert {'c'} == {f.name for f in rpath.iterdir()}
   (rpath/'c').unlink()
   assert not (rpath/'c').exists()
+  with pytest.raises(FileNotFoundError):
+    (rpath/'c').unlink()
+
+def test_read_text_root(rpath: rpathlib.RPath):
+  with pytest.raises(IsADirectoryError):
+    rpathlib.RPath('', remote=rpath.remote).read_text()
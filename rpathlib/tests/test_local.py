@@ -0,0 +1,38 @@
+import os
+import pytest
+import tempfile
+import rpathlib
+
+@pytest.fixture
+def local(rclone):
+  with tempfile.TemporaryDirectory() as tmpdir:
+    yield rpathlib.RPath(tmpdir)
+
+def test_local_item(local: rpathlib.RPath):
+  (local/'d').mkdir()
+  (local/'f').write_text('hi\n')
+  (local/'f.txt').write_text('hi\n')
+  # absolute local paths skip rclone, they should report exactly what rclone would
+  for p in (local, local/'d', local/'f', local/'f.txt'):
+    ret = rpathlib.RPath.client('operations/stat', json_body=dict(fs=p._fs, remote=p._remote, opt=rpathlib._STAT_OPT))
+    assert p.stat() == ret['item']
+  ret = rpathlib.RPath.client('operations/list', json_body=dict(fs=local._fs, remote=local._remote, opt=rpathlib._STAT_OPT))
+  assert local.stat_many(['d', 'f', 'f.txt']) == {item['Name']: item for item in ret['list']}
+
+def test_local_write_text_parents(local: rpathlib.RPath):
+  assert (local/'a'/'b'/'c').write_text('hi') == 2
+  assert (local/'a'/'b').stat()['IsDir']
+  assert (local/'a'/'b'/'c').read_text() == 'hi'
+  assert {local/'a'/'b'/'c'} == set(local.rglob('c'))
+
+def test_local_symlinks(local: rpathlib.RPath):
+  (local/'real').write_text('hi\n')
+  os.symlink(local.path/'missing', local.path/'dangling')
+  os.symlink(local.path/'real', local.path/'link')
+  # rclone skips symlinks unless told to follow/copy them, so should we
+  ret = rpathlib.RPath.client('operations/list', json_body=dict(fs=local._fs, remote=local._remote, opt=rpathlib._STAT_OPT))
+  assert {item['Name'] for item in ret['list']} == {f.name for f in local.iterdir()} == {'real'}
+  assert local.exists_many(['real', 'dangling', 'link']) == {'real': True, 'dangling': False, 'link': False}
+  assert {local/'real'} == set(local.rglob('*'))
+  with pytest.raises(FileNotFoundError):
+    (local/'link').stat()
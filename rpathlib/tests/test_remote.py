@@ -0,0 +1,19 @@
+import pytest
+from rpathlib import _split_remote
+
+@pytest.mark.parametrize('location,expected', [
+  ('/tmp/a', (None, '/tmp/a')),
+  ('a/b', (None, 'a/b')),
+  (':local:', (':local:', '')),
+  ('remote:a/b', ('remote:', 'a/b')),
+  ('remote:a:b', ('remote:', 'a:b')),
+  (':s3,endpoint="http://localhost:9000":test', (':s3,endpoint="http://localhost:9000":', 'test')),
+  ('"unterminated:a', (None, '"unterminated:a')),
+  ('::a', (None, '::a')),
+])
+def test_split_remote(location, expected):
+  assert _split_remote(location) == expected
+
+def test_split_remote_pathological():
+  # this used to backtrack catastrophically with the regex-based parser
+  assert _split_remote('a'*64 + '"') == (None, 'a'*64 + '"')